@@ -31,6 +31,11 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--output-gl-sast", type=str, default="gl-sast-report.json")
     parser.add_argument("--output-ci-gates", type=str, default="argus-ci-gates.json")
     parser.add_argument("--allow-local-verify", action="store_true")
+    parser.add_argument(
+        "--lean-worker-projects",
+        action="store_true",
+        help="Give each verification worker its own hard-linked Lean project",
+    )
     parser.add_argument("--skip-gitlab-publish", action="store_true")
     return parser
 
@@ -44,7 +49,10 @@ def main() -> int:
         print(json.dumps({"status": "no-python-files-found"}, indent=2))
         return 0
 
-    config = PipelineConfig(require_docker_verify=not args.allow_local_verify)
+    config = PipelineConfig(
+        require_docker_verify=not args.allow_local_verify,
+        lean_worker_projects=args.lean_worker_projects,
+    )
     pipeline = ArgusPipeline(config=config)
     reports = pipeline.run_many(files)
 
@@ -106,9 +114,12 @@ def _collect_target_files(args: argparse.Namespace, repo_root: Path) -> List[Tup
             items: List[Tuple[str, str]] = []
             for rel in changed:
                 path = repo_root / rel
-                if not path.exists() or "legacy" in path.parts:
+                if "legacy" in path.parts:
+                    continue
+                try:
+                    items.append((rel, path.read_text(encoding="utf-8")))
+                except FileNotFoundError:
                     continue
-                items.append((rel, path.read_text(encoding="utf-8")))
             return items
 
     discovered = discover_python_files(repo_root)
@@ -20,7 +20,7 @@ class Verdict(str, Enum):
     ERROR = "ERROR"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Obligation:
     id: str
     property: str
@@ -35,7 +35,7 @@ class Obligation:
         return data
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AssumedInput:
     property: str
     description: str
@@ -51,7 +51,7 @@ class AssumedInput:
         return data
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ObligationResult:
     obligation: Obligation
     verified: bool
@@ -67,7 +67,7 @@ class ObligationResult:
         }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VerificationSummary:
     obligation_results: List[ObligationResult]
     assumptions_valid: bool
@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from typing import List, Set
 
 from .models import Obligation, Severity
+from .parsing import parse_python
 
 
 NUMERIC_HINT_NAMES = {"balance", "amount", "total", "count", "value"}
@@ -33,7 +34,7 @@ class ObligationPolicy:
 
     def derive(self, python_code: str) -> ObligationPolicyResult:
         try:
-            tree = ast.parse(python_code)
+            tree = parse_python(python_code)
         except SyntaxError:
             return ObligationPolicyResult(
                 obligations=[],
@@ -67,25 +68,19 @@ class ObligationPolicy:
         param_names = [arg.arg for arg in fn.args.args]
         param_set = {name.lower() for name in param_names}
 
-        has_loop = any(isinstance(node, (ast.For, ast.While)) for node in ast.walk(fn))
-        has_subscript = any(isinstance(node, ast.Subscript) for node in ast.walk(fn))
-        has_minus = any(
-            isinstance(node, ast.BinOp) and isinstance(node.op, ast.Sub)
-            for node in ast.walk(fn)
-        )
-        has_list_append = any(
-            isinstance(node, ast.Call)
-            and isinstance(node.func, ast.Attribute)
-            and node.func.attr == "append"
-            for node in ast.walk(fn)
-        )
-        has_concat_append = any(
-            isinstance(node, ast.BinOp)
-            and isinstance(node.op, ast.Add)
-            and isinstance(node.right, ast.List)
-            and len(node.right.elts) == 1
-            for node in ast.walk(fn)
-        )
+        has_loop = has_subscript = has_minus = has_list_append = has_concat_append = False
+        for node in ast.walk(fn):
+            if isinstance(node, (ast.For, ast.While)):
+                has_loop = True
+            elif isinstance(node, ast.Subscript):
+                has_subscript = True
+            elif isinstance(node, ast.BinOp):
+                if isinstance(node.op, ast.Sub):
+                    has_minus = True
+                elif isinstance(node.op, ast.Add) and isinstance(node.right, ast.List) and len(node.right.elts) == 1:
+                    has_concat_append = True
+            elif isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "append":
+                has_list_append = True
         has_state_hint = bool(param_set.intersection(STATE_HINT_NAMES))
 
         if has_minus or param_set.intersection(NUMERIC_HINT_NAMES):
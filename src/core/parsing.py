@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import ast
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def parse_python(source: str) -> ast.Module:
+    # The returned tree is shared between callers and must not be mutated.
+    return ast.parse(source)
+
+
+class _LoopFound(Exception):
+    pass
+
+
+class _LoopFinder(ast.NodeVisitor):
+    def visit_For(self, node: ast.For) -> None:
+        raise _LoopFound
+
+    def visit_AsyncFor(self, node: ast.AsyncFor) -> None:
+        raise _LoopFound
+
+    def visit_While(self, node: ast.While) -> None:
+        raise _LoopFound
+
+
+def has_loops(tree: ast.AST) -> bool:
+    try:
+        _LoopFinder().visit(tree)
+    except _LoopFound:
+        return True
+    return False
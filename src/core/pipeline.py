@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List
@@ -17,6 +17,8 @@ from .translator import ASTTranslator, DafnyTranslator, LLMTranslator
 from .translator.base import TranslationOutcome
 from .verdict import compute_verdict
 from .verifier import DafnyVerifier, LeanVerifier, VerifierRouter
+from .verifier.base import VerificationOutcome, run_bundle_jobs
+from .verifier.router import EngineSelection
 
 
 @dataclass
@@ -26,6 +28,7 @@ class PipelineConfig:
     trace_root: str = ".argus-trace"
     allow_repair: bool = True
     require_docker_verify: bool = True
+    lean_worker_projects: bool = False
 
 
 @dataclass
@@ -39,6 +42,19 @@ class PipelineResult:
     repaired_code: str | None = None
 
 
+@dataclass
+class _PreparedFile:
+    filename: str
+    python_code: str
+    trace_dir: Path
+    obligations: List[Obligation]
+    assumptions: List[AssumedInput]
+    assumptions_valid: bool
+    translation: TranslationOutcome
+    semantic_guard_passed: bool
+    engine: str
+
+
 class ArgusPipeline:
     def __init__(self, config: PipelineConfig | None = None) -> None:
         self.config = config or PipelineConfig()
@@ -51,7 +67,10 @@ class ArgusPipeline:
         self.ast_translator = ASTTranslator()
         self.llm_translator = LLMTranslator(model=self.config.model)
         self.dafny_translator = DafnyTranslator()
-        self.lean_verifier = LeanVerifier(require_docker=self.config.require_docker_verify)
+        self.lean_verifier = LeanVerifier(
+            require_docker=self.config.require_docker_verify,
+            per_worker_project=self.config.lean_worker_projects,
+        )
         self.dafny_verifier = DafnyVerifier(require_docker=self.config.require_docker_verify)
         self.router = VerifierRouter(self.lean_verifier, self.dafny_verifier)
         self.last_run_id: str | None = None
@@ -76,24 +95,17 @@ class ArgusPipeline:
         allow_repair: bool,
         run_id: str,
     ) -> PipelineResult:
+        prepared = self._prepare_file(filename=filename, python_code=python_code, run_id=run_id)
+        if isinstance(prepared, PipelineResult):
+            return prepared
+        verifier = self.lean_verifier if prepared.engine == "lean" else self.dafny_verifier
+        verification = verifier.verify(prepared.translation.code, prepared.obligations)
+        return self._complete_file(prepared, verification, allow_repair=allow_repair, run_id=run_id)
+
+    def _prepare_file(self, filename: str, python_code: str, run_id: str) -> PipelineResult | _PreparedFile:
         trace_dir = Path(self.config.trace_root) / run_id / "files" / filename
         trace_dir.mkdir(parents=True, exist_ok=True)
 
-        def finalize(result: PipelineResult) -> PipelineResult:
-            self._write_json(
-                trace_dir / "result.json",
-                {
-                    "filename": result.filename,
-                    "verdict": result.verdict.value,
-                    "engine": result.engine,
-                    "message": result.message,
-                    "obligations": [o.to_dict() for o in result.obligations],
-                    "assumptions": [a.to_dict() for a in result.assumptions],
-                    "repaired": bool(result.repaired_code),
-                },
-            )
-            return result
-
         policy = self.policy.derive(python_code)
         discovery = self.discovery.discover(python_code)
         assumptions_valid, issues = validate_assumptions(discovery.assumed_inputs)
@@ -118,7 +130,8 @@ class ArgusPipeline:
                 semantic_guard_passed=False,
             )
             decision = compute_verdict(summary)
-            return finalize(
+            return self._finalize(
+                trace_dir,
                 PipelineResult(
                     filename=filename,
                     verdict=decision.verdict,
@@ -126,10 +139,11 @@ class ArgusPipeline:
                     assumptions=discovery.assumed_inputs,
                     engine="n/a",
                     message=decision.reason,
-                )
+                ),
             )
 
-        translation = self._translate(python_code, policy.obligations, discovery.assumed_inputs)
+        engine_selection = self.router.select_engine(python_code)
+        translation = self._translate(python_code, policy.obligations, discovery.assumed_inputs, engine_selection)
         self._write_text(
             trace_dir / ("02_translation.lean" if translation.language == "lean" else "02_translation.dfy"),
             translation.code if translation.success else translation.error,
@@ -143,7 +157,8 @@ class ArgusPipeline:
                 verification_error=True,
             )
             decision = compute_verdict(summary)
-            return finalize(
+            return self._finalize(
+                trace_dir,
                 PipelineResult(
                     filename=filename,
                     verdict=decision.verdict,
@@ -151,7 +166,7 @@ class ArgusPipeline:
                     assumptions=discovery.assumed_inputs,
                     engine=translation.language,
                     message=translation.error,
-                )
+                ),
             )
 
         guard = run_semantic_guard(python_code, translation.code, policy.obligations)
@@ -162,19 +177,32 @@ class ArgusPipeline:
                 "issues": [{"code": issue.code, "message": issue.message} for issue in guard.issues],
             },
         )
-        engine_selection = self.router.select_engine(python_code)
-        verification = (
-            self.lean_verifier.verify(translation.code, policy.obligations)
-            if engine_selection.engine == "lean"
-            else self.dafny_verifier.verify(translation.code, policy.obligations)
+        return _PreparedFile(
+            filename=filename,
+            python_code=python_code,
+            trace_dir=trace_dir,
+            obligations=policy.obligations,
+            assumptions=discovery.assumed_inputs,
+            assumptions_valid=assumptions_valid,
+            translation=translation,
+            semantic_guard_passed=guard.passed,
+            engine=engine_selection.engine,
         )
 
+    def _complete_file(
+        self,
+        prepared: _PreparedFile,
+        verification: VerificationOutcome,
+        allow_repair: bool,
+        run_id: str,
+    ) -> PipelineResult:
+        trace_dir = prepared.trace_dir
         self._write_text(trace_dir / "03_verify_stdout.txt", verification.raw_output or verification.error_message)
         summary = VerificationSummary(
             obligation_results=verification.obligation_results,
-            assumptions_valid=assumptions_valid,
+            assumptions_valid=prepared.assumptions_valid,
             unsupported_constructs=[],
-            semantic_guard_passed=guard.passed,
+            semantic_guard_passed=prepared.semantic_guard_passed,
             verification_error=verification.verification_error,
             repaired=False,
         )
@@ -183,60 +211,84 @@ class ArgusPipeline:
         repaired_code: str | None = None
         if decision.verdict == Verdict.VULNERABLE and allow_repair and not verification.verification_error:
             repair_result = self.repair.repair(
-                python_code=python_code,
+                python_code=prepared.python_code,
                 error_message=verification.error_message or verification.raw_output,
-                obligations=policy.obligations,
+                obligations=prepared.obligations,
             )
             if repair_result.success and repair_result.fixed_code:
                 repaired_code = repair_result.fixed_code
                 self._write_text(trace_dir / "04_repair_0.py", repaired_code)
-                summary.repaired = True
+                summary = replace(summary, repaired=True)
                 rerun = self._run_file(
-                    filename=f"{filename}_repaired",
+                    filename=f"{prepared.filename}_repaired",
                     python_code=repaired_code,
                     allow_repair=False,
                     run_id=run_id,
                 )
                 if rerun.verdict in {Verdict.VERIFIED, Verdict.FIXED}:
-                    return finalize(
+                    return self._finalize(
+                        trace_dir,
                         PipelineResult(
-                            filename=filename,
+                            filename=prepared.filename,
                             verdict=Verdict.FIXED,
-                            obligations=policy.obligations,
-                            assumptions=discovery.assumed_inputs,
+                            obligations=prepared.obligations,
+                            assumptions=prepared.assumptions,
                             engine=rerun.engine,
                             message="Repaired and verified",
                             repaired_code=repaired_code,
-                        )
+                        ),
                     )
 
-        return finalize(
+        return self._finalize(
+            trace_dir,
             PipelineResult(
-                filename=filename,
+                filename=prepared.filename,
                 verdict=decision.verdict,
-                obligations=policy.obligations,
-                assumptions=discovery.assumed_inputs,
-                engine=engine_selection.engine,
+                obligations=prepared.obligations,
+                assumptions=prepared.assumptions,
+                engine=prepared.engine,
                 message=decision.reason if decision.reason else verification.error_message,
                 repaired_code=repaired_code,
-            )
+            ),
+        )
+
+    def _finalize(self, trace_dir: Path, result: PipelineResult) -> PipelineResult:
+        self._write_json(
+            trace_dir / "result.json",
+            {
+                "filename": result.filename,
+                "verdict": result.verdict.value,
+                "engine": result.engine,
+                "message": result.message,
+                "obligations": [o.to_dict() for o in result.obligations],
+                "assumptions": [a.to_dict() for a in result.assumptions],
+                "repaired": bool(result.repaired_code),
+            },
         )
+        return result
 
     def run_many(self, files: List[tuple[str, str]]) -> List[FileReport]:
         run_id = self._new_run_id()
         self.last_run_id = run_id
         self._write_manifest(run_id=run_id, filenames=[name for name, _ in files], mode="batch")
 
-        results: List[PipelineResult] = []
-        for filename, code in files:
-            results.append(
-                self._run_file(
-                    filename=filename,
-                    python_code=code,
-                    allow_repair=self.config.allow_repair,
-                    run_id=run_id,
-                )
+        prepared = [
+            self._prepare_file(filename=filename, python_code=code, run_id=run_id)
+            for filename, code in files
+        ]
+        pending = [item for item in prepared if isinstance(item, _PreparedFile)]
+        verifications = iter(self._verify_prepared(pending))
+        results: List[PipelineResult] = [
+            item
+            if isinstance(item, PipelineResult)
+            else self._complete_file(
+                item,
+                next(verifications),
+                allow_repair=self.config.allow_repair,
+                run_id=run_id,
             )
+            for item in prepared
+        ]
         self._write_summary(run_id=run_id, results=results)
 
         reports: List[FileReport] = []
@@ -253,13 +305,27 @@ class ArgusPipeline:
             )
         return reports
 
+    def _verify_prepared(self, prepared: List[_PreparedFile]) -> List[VerificationOutcome]:
+        outcomes: List[VerificationOutcome | None] = [None] * len(prepared)
+        for engine, verifier in (("lean", self.lean_verifier), ("dafny", self.dafny_verifier)):
+            indices = [index for index, item in enumerate(prepared) if item.engine == engine]
+            if not indices:
+                continue
+            files = [
+                (prepared[index].filename, prepared[index].translation.code, prepared[index].obligations)
+                for index in indices
+            ]
+            for index, outcome in zip(indices, run_bundle_jobs(verifier.verify_bundle, files)):
+                outcomes[index] = outcome
+        return outcomes
+
     def _translate(
         self,
         python_code: str,
         obligations: List[Obligation],
         assumptions: List[AssumedInput],
+        selection: EngineSelection,
     ) -> TranslationOutcome:
-        selection = self.router.select_engine(python_code)
         if selection.engine == "dafny":
             return self.dafny_translator.translate(python_code, obligations, assumptions)
 
@@ -9,7 +9,7 @@ from typing import Any, Dict, List
 from .models import AssumedInput, Obligation, Verdict
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FileReport:
     filename: str
     verdict: Verdict
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from typing import List
 
 from .models import Obligation
+from .parsing import parse_python
 
 
 @dataclass(frozen=True)
@@ -90,7 +91,7 @@ def run_semantic_guard(
 
 def _extract_python_function_names(code: str) -> set[str]:
     try:
-        tree = ast.parse(code)
+        tree = parse_python(code)
     except SyntaxError:
         return set()
     return {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
@@ -4,6 +4,7 @@ import ast
 from typing import List
 
 from ..models import AssumedInput, Obligation
+from ..parsing import parse_python
 from .base import TranslationOutcome
 
 
@@ -23,7 +24,7 @@ class ASTTranslator:
         assumptions: List[AssumedInput],
     ) -> TranslationOutcome:
         try:
-            tree = ast.parse(python_code)
+            tree = parse_python(python_code)
         except SyntaxError as exc:
             return TranslationOutcome(
                 success=False,
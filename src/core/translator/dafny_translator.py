@@ -4,6 +4,7 @@ import ast
 from typing import List
 
 from ..models import AssumedInput, Obligation
+from ..parsing import has_loops, parse_python
 from .base import TranslationOutcome
 
 
@@ -17,7 +18,7 @@ class DafnyTranslator:
         assumptions: List[AssumedInput],
     ) -> TranslationOutcome:
         try:
-            tree = ast.parse(python_code)
+            tree = parse_python(python_code)
         except SyntaxError as exc:
             return TranslationOutcome(
                 success=False,
@@ -56,7 +57,7 @@ class DafnyTranslator:
         for item in obligations:
             lines.append(f"  // OBLIGATION: {item.property}")
         lines.append("{")
-        if any(isinstance(node, (ast.For, ast.While)) for node in ast.walk(fn)):
+        if has_loops(fn):
             lines.extend(
                 [
                     "  var i := 0;",
@@ -1,11 +1,29 @@
 from __future__ import annotations
 
+import atexit
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Protocol
+from pathlib import Path
+from typing import Callable, Dict, List, Protocol, Tuple
 
 from ..models import Obligation, ObligationResult
 
 
+DEFAULT_BUNDLE_MAX_BYTES = 256 * 1024
+
+BUNDLE_TIMEOUT_FACTOR = 2
+
+RUNNING_IN_DOCKER = Path("/.dockerenv").exists()
+
+BundleItem = Tuple[str, str, List[Obligation]]
+
+
 @dataclass
 class VerificationOutcome:
     engine: str
@@ -25,3 +43,232 @@ class Verifier(Protocol):
     def verify(self, proof_code: str, obligations: List[Obligation]) -> VerificationOutcome:
         ...
 
+    def verify_bundle(self, files: List[BundleItem]) -> List[VerificationOutcome]:
+        ...
+
+
+def allow_local_verify() -> bool:
+    return os.getenv("ARGUS_ALLOW_LOCAL_VERIFY", "false").lower() == "true"
+
+
+class VerificationCache:
+    def __init__(self, max_entries: int | None = None) -> None:
+        self.max_entries = verify_cache_size() if max_entries is None else max_entries
+        self._entries: OrderedDict[bytes, Tuple[Dict[str, Tuple[bool, str]], str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, engine: str, proof_code: str, obligations: List[Obligation]) -> VerificationOutcome | None:
+        key = self._key(engine, proof_code, obligations)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        results, raw_output, error_message = entry
+        return VerificationOutcome(
+            engine=engine,
+            obligation_results=[
+                ObligationResult(
+                    obligation=item,
+                    verified=results[item.id][0],
+                    engine=engine,
+                    message=results[item.id][1],
+                )
+                for item in obligations
+            ],
+            raw_output=raw_output,
+            verification_error=False,
+            error_message=error_message,
+        )
+
+    def put(self, outcome: VerificationOutcome, proof_code: str, obligations: List[Obligation]) -> None:
+        if outcome.verification_error or self.max_entries <= 0:
+            return
+        key = self._key(outcome.engine, proof_code, obligations)
+        results = {item.obligation.id: (item.verified, item.message) for item in outcome.obligation_results}
+        with self._lock:
+            self._entries[key] = (results, outcome.raw_output, outcome.error_message)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _key(self, engine: str, proof_code: str, obligations: List[Obligation]) -> bytes:
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{engine}\0{proof_code}\0".encode("utf-8"))
+        digest.update("\0".join(sorted(item.id for item in obligations)).encode("utf-8"))
+        return digest.digest()
+
+
+def verify_cache_size() -> int:
+    try:
+        return int(os.getenv("ARGUS_VERIFY_CACHE", "512"))
+    except ValueError:
+        return 512
+
+
+def verify_workers() -> int:
+    default = min(os.cpu_count() or 4, 8)
+    try:
+        return max(1, int(os.getenv("ARGUS_VERIFY_WORKERS", str(default))))
+    except ValueError:
+        return default
+
+
+def run_bundle_jobs(
+    verify_bundle: Callable[[List[BundleItem]], List[VerificationOutcome]],
+    files: List[BundleItem],
+) -> List[VerificationOutcome]:
+    workers = min(verify_workers(), len(files))
+    if workers <= 1:
+        return verify_bundle(files)
+    size = -(-len(files) // workers)
+    chunks = [files[start : start + size] for start in range(0, len(files), size)]
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        return [outcome for outcomes in executor.map(verify_bundle, chunks) for outcome in outcomes]
+
+
+def bundle_max_bytes() -> int:
+    try:
+        return int(os.getenv("ARGUS_BUNDLE_MAX_BYTES", str(DEFAULT_BUNDLE_MAX_BYTES)))
+    except ValueError:
+        return DEFAULT_BUNDLE_MAX_BYTES
+
+
+def should_bundle(files: List[BundleItem]) -> bool:
+    if len(files) < 2:
+        return False
+    return sum(len(code.encode("utf-8")) for _, code, _ in files) <= bundle_max_bytes()
+
+
+class BaseVerifier:
+    engine = ""
+
+    def __init__(self, timeout: int, require_docker: bool) -> None:
+        self.timeout = timeout
+        self.require_docker = require_docker
+        self._cache = VerificationCache()
+        self.refresh_env()
+
+    def refresh_env(self) -> None:
+        self._allow_local_verify = allow_local_verify()
+
+    def verify(self, proof_code: str, obligations: List[Obligation]) -> VerificationOutcome:
+        if self._docker_gate_closed():
+            return VerificationOutcome(
+                engine=self.engine,
+                obligation_results=self._all_failed(obligations, "Docker-only verification is enabled"),
+                raw_output="",
+                verification_error=True,
+                error_message="Docker-only verification is enabled (set ARGUS_ALLOW_LOCAL_VERIFY=true to override)",
+            )
+
+        cached = self._cache.get(self.engine, proof_code, obligations)
+        if cached is not None:
+            return cached
+        try:
+            verified, output = self._check(proof_code, self.timeout)
+        except Exception as exc:
+            message = str(exc)
+            return VerificationOutcome(
+                engine=self.engine,
+                obligation_results=self._all_failed(obligations, message),
+                raw_output="",
+                verification_error=True,
+                error_message=message,
+            )
+        outcome = None if verified else self._attribute_failure(proof_code, obligations, output)
+        if outcome is None:
+            outcome = self._outcome(obligations, verified, output)
+        self._cache.put(outcome, proof_code, obligations)
+        return outcome
+
+    def verify_bundle(self, files: List[BundleItem]) -> List[VerificationOutcome]:
+        if self._docker_gate_closed():
+            return [self.verify(code, obligations) for _, code, obligations in files]
+        outcomes = [self._cache.get(self.engine, code, obligations) for _, code, obligations in files]
+        missing = [index for index, outcome in enumerate(outcomes) if outcome is None]
+        for index, outcome in zip(missing, self._verify_uncached_bundle([files[index] for index in missing])):
+            outcomes[index] = outcome
+        return outcomes
+
+    def _verify_uncached_bundle(self, files: List[BundleItem]) -> List[VerificationOutcome]:
+        return [self.verify(code, obligations) for _, code, obligations in files]
+
+    def _bundle_timeout(self, files: List[BundleItem]) -> int:
+        return self.timeout * min(len(files), BUNDLE_TIMEOUT_FACTOR)
+
+    def _check(self, proof_code: str, timeout: int) -> Tuple[bool, str]:
+        raise NotImplementedError
+
+    def _attribute_failure(
+        self,
+        proof_code: str,
+        obligations: List[Obligation],
+        output: str,
+    ) -> VerificationOutcome | None:
+        return None
+
+    def _passed(self, code: str, obligations: List[Obligation], output: str) -> VerificationOutcome:
+        outcome = self._outcome(obligations, True, output)
+        self._cache.put(outcome, code, obligations)
+        return outcome
+
+    def _outcome(self, obligations: List[Obligation], verified: bool, output: str) -> VerificationOutcome:
+        message = "" if verified else output[:400]
+        return VerificationOutcome(
+            engine=self.engine,
+            obligation_results=[
+                ObligationResult(obligation=item, verified=verified, engine=self.engine, message=message)
+                for item in obligations
+            ],
+            raw_output=output,
+            verification_error=False,
+            error_message=message,
+        )
+
+    def _docker_gate_closed(self) -> bool:
+        return self.require_docker and not RUNNING_IN_DOCKER and not self._allow_local_verify
+
+    def _all_failed(self, obligations: List[Obligation], message: str) -> List[ObligationResult]:
+        return [
+            ObligationResult(obligation=item, verified=False, engine=self.engine, message=message)
+            for item in obligations
+        ]
+
+
+_scratch_local = threading.local()
+_scratch_lock = threading.Lock()
+_scratch_dirs: Dict[int, Path] = {}
+
+
+def scratch_dir() -> Path:
+    pid = os.getpid()
+    with _scratch_lock:
+        directory = _scratch_dirs.get(pid)
+        if directory is None:
+            directory = _scratch_dirs[pid] = Path(tempfile.mkdtemp(prefix="argus_scratch_"))
+    return directory
+
+
+def write_scratch_source(suffix: str, source: str) -> Path:
+    paths: Dict[str, Path] | None = getattr(_scratch_local, "paths", None)
+    if paths is None or getattr(_scratch_local, "pid", None) != os.getpid():
+        paths = _scratch_local.paths = {}
+        _scratch_local.pid = os.getpid()
+    path = paths.get(suffix)
+    if path is None:
+        path = paths[suffix] = scratch_dir() / f"argus_{threading.get_ident()}{suffix}"
+    path.write_text(source, encoding="utf-8")
+    return path
+
+
+@atexit.register
+def _remove_scratch_dirs() -> None:
+    with _scratch_lock:
+        directory = _scratch_dirs.pop(os.getpid(), None)
+    if directory is not None:
+        shutil.rmtree(directory, ignore_errors=True)
@@ -1,80 +1,180 @@
 from __future__ import annotations
 
 import os
+import re
 import subprocess
-import tempfile
-import uuid
-from pathlib import Path
-from typing import List
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Dict, List, Sequence, Set, Tuple
 
 from ..models import Obligation, ObligationResult
-from .base import VerificationOutcome
+from .base import BaseVerifier, BundleItem, VerificationOutcome, should_bundle, write_scratch_source
+
+
+ERROR_COUNT_PATTERN = re.compile(r"\b([1-9][0-9]*)\s+errors?\b", re.IGNORECASE)
+ERROR_LOCATION_PATTERN = re.compile(r"\((\d+),\d+\): Error\b:?\s*(.*)")
+VERIFIER_SUMMARY_PATTERN = re.compile(
+    r"verifier finished with \d+ verified, (\d+) errors?(?:, (\d+) time outs?)?(?:, (\d+) out of resource)?",
+    re.IGNORECASE,
+)
+DECLARATION_PATTERN = re.compile(
+    r"^(\s*(?:(?:ghost|static|opaque|twostate|greatest|least)\s+)*"
+    r"(?:method|lemma|function|predicate|constructor|iterator)(?:\s+method)?\b\s*)"
+    r"((?:\{[^}]*\}\s*)*)(\w*)",
+    re.MULTILINE,
+)
+
 
+@lru_cache(maxsize=1)
+def dafny_accepts_stdin() -> bool:
+    try:
+        result = subprocess.run(
+            ["dafny", "verify", "--help"],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except Exception:
+        return False
+    return "--stdin" in f"{result.stdout}\n{result.stderr}"
+
+
+class DafnyVerifier(BaseVerifier):
+    engine = "dafny"
 
-class DafnyVerifier:
     def __init__(self, timeout: int = 120, require_docker: bool = True) -> None:
-        self.timeout = timeout
-        self.require_docker = require_docker
-
-    def verify(self, proof_code: str, obligations: List[Obligation]) -> VerificationOutcome:
-        if self.require_docker and not self._running_in_docker() and not self._allow_local():
-            return VerificationOutcome(
-                engine="dafny",
-                obligation_results=self._all_failed(obligations, "Docker-only verification is enabled"),
-                raw_output="",
-                verification_error=True,
-                error_message="Docker-only verification is enabled (set ARGUS_ALLOW_LOCAL_VERIFY=true to override)",
-            )
+        super().__init__(timeout=timeout, require_docker=require_docker)
+
+    def _verify_uncached_bundle(self, files: List[BundleItem]) -> List[VerificationOutcome]:
+        if not should_bundle(files):
+            return [self.verify(code, obligations) for _, code, obligations in files]
 
-        path = Path(tempfile.gettempdir()) / f"argus_{uuid.uuid4().hex}.dfy"
+        modules = [f"module M_{index} {{\n{code}\n}}" for index, (_, code, _) in enumerate(files)]
+        module_starts = []
+        line = 1
+        for module in modules:
+            module_starts.append(line)
+            line += module.count("\n") + 2
         try:
-            path.write_text(proof_code, encoding="utf-8")
-            result = subprocess.run(
-                ["dafny", "verify", str(path)],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
+            verified, output = self._check("\n\n".join(modules), self._bundle_timeout(files))
+        except Exception:
+            verified, output = False, ""
+        failing = set(range(len(files))) if not verified else set()
+        if not verified and output:
+            failing = self._failing_modules(module_starts, output) or failing
+        return [
+            self.verify(code, obligations) if index in failing else self._passed(code, obligations, output)
+            for index, (_, code, obligations) in enumerate(files)
+        ]
+
+    def _failing_modules(self, module_starts: List[int], output: str) -> Set[int]:
+        failing: Set[int] = set()
+        for line in self._error_lines(output):
+            index = bisect_right(module_starts, line) - 1
+            if index < 0:
+                return set()
+            failing.add(index)
+        return failing
+
+    def _error_lines(self, output: str) -> List[int]:
+        summary = VERIFIER_SUMMARY_PATTERN.search(output)
+        if summary is None or int(summary.group(2) or 0) or int(summary.group(3) or 0):
+            return []
+        lines = [int(match.group(1)) for match in ERROR_LOCATION_PATTERN.finditer(output)]
+        return lines if len(lines) == int(summary.group(1)) else []
+
+    def _attribute_failure(
+        self,
+        proof_code: str,
+        obligations: List[Obligation],
+        output: str,
+    ) -> VerificationOutcome | None:
+        failing = self._failing_declarations(proof_code, output)
+        if not failing:
+            return None
+        declared = {name.lower() for name in self._declaration_lines(proof_code)[1]}
+        owners = {item.id.split(":", 1)[0].lower() for item in obligations}
+        if not owners <= declared or not {name.lower() for name in failing} <= owners:
+            return None
+
+        isolated_code = DECLARATION_PATTERN.sub(
+            lambda match: (
+                f"{match.group(1)}{{:isolate_assertions}} {match.group(2)}{match.group(3)}"
+                if match.group(3) in failing and "isolate_assertions" not in match.group(2)
+                else match.group(0)
+            ),
+            proof_code,
+        )
+        try:
+            _, isolated_output = self._check(
+                isolated_code,
+                max(1, self.timeout // 2),
+                ("--cores", str(os.cpu_count() or 1)),
             )
-            output = (result.stdout + "\n" + result.stderr).strip()
-            has_positive_error_count = re.search(r"\b([1-9][0-9]*)\s+errors?\b", output.lower()) is not None
-            verified = result.returncode == 0 and not has_positive_error_count
-            obligation_results = [
+            isolated = self._failing_declarations(isolated_code, isolated_output)
+            if isolated and {name.lower() for name in isolated} <= owners:
+                failing = isolated
+            output = f"{output}\n\n{isolated_output}".strip()
+        except Exception:
+            pass
+
+        failing_by_owner = {name.lower(): "\n".join(errors)[:400] for name, errors in failing.items()}
+        obligation_results = []
+        for item in obligations:
+            message = failing_by_owner.get(item.id.split(":", 1)[0].lower())
+            obligation_results.append(
                 ObligationResult(
                     obligation=item,
-                    verified=verified,
-                    engine="dafny",
-                    message="" if verified else output[:400],
+                    verified=message is None,
+                    engine=self.engine,
+                    message=message or "",
                 )
-                for item in obligations
-            ]
-            return VerificationOutcome(
-                engine="dafny",
-                obligation_results=obligation_results,
-                raw_output=output,
-                verification_error=False,
-                error_message="" if verified else output[:400],
-            )
-        except Exception as exc:
-            return VerificationOutcome(
-                engine="dafny",
-                obligation_results=self._all_failed(obligations, str(exc)),
-                raw_output="",
-                verification_error=True,
-                error_message=str(exc),
             )
-        finally:
-            if path.exists():
-                path.unlink()
+        return VerificationOutcome(
+            engine=self.engine,
+            obligation_results=obligation_results,
+            raw_output=output,
+            verification_error=False,
+            error_message=next(iter(failing_by_owner.values())),
+        )
 
-    def _running_in_docker(self) -> bool:
-        return Path("/.dockerenv").exists()
+    def _failing_declarations(self, proof_code: str, output: str) -> Dict[str, List[str]]:
+        if not self._error_lines(output):
+            return {}
+        starts, names = self._declaration_lines(proof_code)
+        failing: Dict[str, List[str]] = {}
+        for match in ERROR_LOCATION_PATTERN.finditer(output):
+            index = bisect_right(starts, int(match.group(1))) - 1
+            if index < 0:
+                return {}
+            failing.setdefault(names[index], []).append(match.group(0).strip())
+        return failing
 
-    def _allow_local(self) -> bool:
-        return os.getenv("ARGUS_ALLOW_LOCAL_VERIFY", "false").lower() == "true"
+    def _declaration_lines(self, proof_code: str) -> Tuple[List[int], List[str]]:
+        starts: List[int] = []
+        names: List[str] = []
+        for match in DECLARATION_PATTERN.finditer(proof_code):
+            starts.append(proof_code.count("\n", 0, match.start(3)) + 1)
+            names.append(match.group(3))
+        return starts, names
 
-    def _all_failed(self, obligations: List[Obligation], message: str) -> List[ObligationResult]:
-        return [
-            ObligationResult(obligation=item, verified=False, engine="dafny", message=message)
-            for item in obligations
-        ]
-import re
+    def _check(self, proof_code: str, timeout: int, extra_args: Sequence[str] = ()) -> Tuple[bool, str]:
+        if dafny_accepts_stdin():
+            result = subprocess.run(
+                ["dafny", "verify", *extra_args, "--stdin"],
+                input=proof_code,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        else:
+            path = write_scratch_source(".dfy", proof_code)
+            result = subprocess.run(
+                ["dafny", "verify", *extra_args, str(path)],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        output = (result.stdout + "\n" + result.stderr).strip()
+        has_positive_error_count = ERROR_COUNT_PATTERN.search(output) is not None
+        return result.returncode == 0 and not has_positive_error_count, output
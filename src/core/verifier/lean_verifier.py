@@ -1,81 +1,184 @@
 from __future__ import annotations
 
 import os
+import re
+import shutil
 import subprocess
 import tempfile
-import uuid
+import threading
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, FrozenSet, Iterator, List, Tuple
 
-from ..models import Obligation, ObligationResult
-from .base import VerificationOutcome
+from .base import BaseVerifier, BundleItem, VerificationOutcome, should_bundle, write_scratch_source
 
 
-class LeanVerifier:
+GLOBAL_COMMAND_PATTERN = re.compile(
+    r"^\s*(?:@\[|attribute\b|(?:\w+\s+)*instance\b|notation\b|infix[lr]?\b|prefix\b|postfix\b"
+    r"|macro(?:_rules)?\b|syntax\b|elab(?:_rules)?\b|declare_syntax_cat\b|deriving\b|export\b|initialize\b)"
+    r"|\b_root_\.",
+    re.MULTILINE,
+)
+
+
+@lru_cache(maxsize=64)
+def lean_accepts_stdin(project_dir: str) -> bool:
+    try:
+        result = subprocess.run(
+            ["lake", "env", "lean", "--help"],
+            cwd=project_dir,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except Exception:
+        return False
+    return "--stdin" in f"{result.stdout}\n{result.stderr}"
+
+
+def _link_project(source: Path, target: Path) -> None:
+    for entry in source.iterdir():
+        if entry.name == ".lake" or entry.name.startswith("argus_"):
+            continue
+        (target / entry.name).symlink_to(entry)
+    lake_dir = source / ".lake"
+    if not lake_dir.is_dir():
+        return
+    (target / ".lake").mkdir()
+    for entry in lake_dir.iterdir():
+        if entry.name == "build" and entry.is_dir():
+            _hard_link_tree(entry, target / ".lake" / "build")
+        else:
+            (target / ".lake" / entry.name).symlink_to(entry)
+
+
+def _hard_link_tree(source: Path, target: Path) -> None:
+    for root, _, files in os.walk(source):
+        destination = target / Path(root).relative_to(source)
+        destination.mkdir(parents=True, exist_ok=True)
+        for name in files:
+            try:
+                os.link(Path(root) / name, destination / name)
+            except OSError:
+                shutil.copy2(Path(root) / name, destination / name)
+
+
+def _imports(code: str) -> FrozenSet[str]:
+    return frozenset(line for line in code.splitlines() if line.startswith("import "))
+
+
+def _remove_scratch_dirs(scratch_dirs: List[Path], idle_dirs: List[Path]) -> None:
+    idle_dirs.clear()
+    while scratch_dirs:
+        shutil.rmtree(scratch_dirs.pop(), ignore_errors=True)
+
+
+class LeanVerifier(BaseVerifier):
+    engine = "lean"
+
     def __init__(
         self,
         project_dir: str | None = None,
         timeout: int = 60,
         require_docker: bool = True,
+        per_worker_project: bool = False,
     ) -> None:
         self.project_dir = project_dir
-        self.timeout = timeout
-        self.require_docker = require_docker
-
-    def verify(self, proof_code: str, obligations: List[Obligation]) -> VerificationOutcome:
-        if self.require_docker and not self._running_in_docker() and not self._allow_local():
-            return VerificationOutcome(
-                engine="lean",
-                obligation_results=self._all_failed(obligations, "Docker-only verification is enabled"),
-                raw_output="",
-                verification_error=True,
-                error_message="Docker-only verification is enabled (set ARGUS_ALLOW_LOCAL_VERIFY=true to override)",
-            )
+        self.per_worker_project = per_worker_project
+        self._scratch_lock = threading.Lock()
+        self._scratch_dirs: List[Path] = []
+        self._idle_dirs: List[Path] = []
+        self._finalizer = weakref.finalize(self, _remove_scratch_dirs, self._scratch_dirs, self._idle_dirs)
+        super().__init__(timeout=timeout, require_docker=require_docker)
 
-        project_dir = self._resolve_project_dir()
-        filename = f"argus_{uuid.uuid4().hex}.lean"
-        file_path = project_dir / filename
+    def close(self) -> None:
+        self._finalizer()
+
+    def _verify_uncached_bundle(self, files: List[BundleItem]) -> List[VerificationOutcome]:
+        groups: Dict[FrozenSet[str], List[int]] = {}
+        outcomes: List[VerificationOutcome | None] = [None] * len(files)
+        for index, (_, code, obligations) in enumerate(files):
+            if GLOBAL_COMMAND_PATTERN.search(code):
+                outcomes[index] = self.verify(code, obligations)
+            else:
+                groups.setdefault(_imports(code), []).append(index)
+        for indices in groups.values():
+            for index, outcome in zip(indices, self._verify_same_imports([files[index] for index in indices])):
+                outcomes[index] = outcome
+        return outcomes
+
+    def _verify_same_imports(self, files: List[BundleItem]) -> List[VerificationOutcome]:
+        if not should_bundle(files):
+            return [self.verify(code, obligations) for _, code, obligations in files]
 
         try:
-            file_path.write_text(proof_code, encoding="utf-8")
-            command = ["lake", "env", "lean", filename]
-            result = subprocess.run(
-                command,
-                cwd=str(project_dir),
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-            )
-            output = (result.stdout + "\n" + result.stderr).strip()
+            verified, output = self._check(self._combine(files), self._bundle_timeout(files))
+        except Exception:
+            verified, output = False, ""
+        if not verified:
+            return [self.verify(code, obligations) for _, code, obligations in files]
+        return [self._passed(code, obligations, output) for _, code, obligations in files]
+
+    def _combine(self, files: List[BundleItem]) -> str:
+        imports: List[str] = []
+        sections: List[str] = []
+        for index, (_, code, _) in enumerate(files):
+            body: List[str] = []
+            for line in code.splitlines():
+                if line.startswith("import "):
+                    if line not in imports:
+                        imports.append(line)
+                else:
+                    body.append(line)
+            sections.append(f"namespace argus_{index}\n" + "\n".join(body) + f"\nend argus_{index}")
+        return "\n".join(imports) + "\n\n" + "\n\n".join(sections) + "\n"
 
-            verified = result.returncode == 0 and "sorry" not in proof_code
-            obligation_results = [
-                ObligationResult(
-                    obligation=item,
-                    verified=verified,
-                    engine="lean",
-                    message="" if verified else output[:400],
+    def _check(self, proof_code: str, timeout: int) -> Tuple[bool, str]:
+        with self._checkout_project_dir() as project_dir:
+            if lean_accepts_stdin(str(self._resolve_project_dir())):
+                result = subprocess.run(
+                    ["lake", "env", "lean", "--stdin"],
+                    input=proof_code,
+                    cwd=str(project_dir),
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
                 )
-                for item in obligations
-            ]
-            return VerificationOutcome(
-                engine="lean",
-                obligation_results=obligation_results,
-                raw_output=output,
-                verification_error=False,
-                error_message="" if verified else output[:400],
-            )
-        except Exception as exc:
-            return VerificationOutcome(
-                engine="lean",
-                obligation_results=self._all_failed(obligations, str(exc)),
-                raw_output="",
-                verification_error=True,
-                error_message=str(exc),
-            )
+            else:
+                file_path = write_scratch_source(".lean", proof_code)
+                command = ["lake", "env", "lean", str(file_path)]
+                result = subprocess.run(
+                    command,
+                    cwd=str(project_dir),
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                )
+            output = (result.stdout + "\n" + result.stderr).strip()
+            return result.returncode == 0 and "sorry" not in proof_code, output
+
+    @contextmanager
+    def _checkout_project_dir(self) -> Iterator[Path]:
+        project_dir = self._resolve_project_dir()
+        if not self.per_worker_project or not any(
+            (project_dir / name).exists() for name in ("lakefile.lean", "lakefile.toml")
+        ):
+            yield project_dir
+            return
+        with self._scratch_lock:
+            scratch = self._idle_dirs.pop() if self._idle_dirs else None
+        if scratch is None:
+            scratch = Path(tempfile.mkdtemp(prefix="argus_lean_worker_"))
+            with self._scratch_lock:
+                self._scratch_dirs.append(scratch)
+            _link_project(project_dir, scratch)
+        try:
+            yield scratch
         finally:
-            if file_path.exists():
-                file_path.unlink()
+            with self._scratch_lock:
+                self._idle_dirs.append(scratch)
 
     def _resolve_project_dir(self) -> Path:
         if self.project_dir:
@@ -84,16 +187,3 @@ class LeanVerifier:
         if candidate.exists():
             return candidate
         return Path(tempfile.gettempdir())
-
-    def _running_in_docker(self) -> bool:
-        return Path("/.dockerenv").exists()
-
-    def _allow_local(self) -> bool:
-        return os.getenv("ARGUS_ALLOW_LOCAL_VERIFY", "false").lower() == "true"
-
-    def _all_failed(self, obligations: List[Obligation], message: str) -> List[ObligationResult]:
-        return [
-            ObligationResult(obligation=item, verified=False, engine="lean", message=message)
-            for item in obligations
-        ]
-
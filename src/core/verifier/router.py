@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-import ast
 from dataclasses import dataclass
+from functools import lru_cache
 
+from ..parsing import has_loops, parse_python
 from .dafny_verifier import DafnyVerifier
 from .lean_verifier import LeanVerifier
 
@@ -24,13 +25,15 @@ class VerifierRouter:
         self.dafny = dafny
 
     def select_engine(self, python_code: str) -> EngineSelection:
-        try:
-            tree = ast.parse(python_code)
-        except SyntaxError:
-            return EngineSelection(engine="lean", reason="syntax_error_fallback")
-
-        has_loops = any(isinstance(node, (ast.For, ast.While)) for node in ast.walk(tree))
-        if has_loops:
-            return EngineSelection(engine="dafny", reason="loop_detected")
-        return EngineSelection(engine="lean", reason="non_loop_code")
-
+        return _select_for_source(python_code)
+
+
+@lru_cache(maxsize=1024)
+def _select_for_source(python_code: str) -> EngineSelection:
+    try:
+        tree = parse_python(python_code)
+    except SyntaxError:
+        return EngineSelection(engine="lean", reason="syntax_error_fallback")
+    if has_loops(tree):
+        return EngineSelection(engine="dafny", reason="loop_detected")
+    return EngineSelection(engine="lean", reason="non_loop_code")
@@ -1,28 +1,56 @@
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
 import pathspec
 
 
+SKIPPED_DIR_NAMES = frozenset({"venv", "__pycache__", ".git", "legacy"})
+
+
 def load_argusignore(repo_root: Path) -> pathspec.PathSpec:
     ignore_file = repo_root / ".argusignore"
-    if not ignore_file.exists():
+    try:
+        stat = ignore_file.stat()
+    except OSError:
+        return _compile_argusignore(str(ignore_file), None, None)
+    return _compile_argusignore(str(ignore_file), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _compile_argusignore(ignore_file: str, mtime_ns: int | None, size: int | None) -> pathspec.PathSpec:
+    if mtime_ns is None:
         return pathspec.PathSpec.from_lines("gitwildmatch", [])
-    return pathspec.PathSpec.from_lines("gitwildmatch", ignore_file.read_text(encoding="utf-8").splitlines())
+    return pathspec.PathSpec.from_lines("gitwildmatch", Path(ignore_file).read_text(encoding="utf-8").splitlines())
 
 
 def discover_python_files(repo_root: Path, extra_excludes: Iterable[str] | None = None) -> List[Path]:
     spec = load_argusignore(repo_root)
     excludes = set(extra_excludes or [])
+    match_file = spec.match_file if spec.patterns else None
     files: List[Path] = []
-    for path in repo_root.rglob("*.py"):
-        rel = path.relative_to(repo_root).as_posix()
-        if any(part in {"venv", "__pycache__", ".git", "legacy"} for part in path.parts):
+    for rel in _walk_python_files(str(repo_root), ""):
+        if rel in excludes or (match_file is not None and match_file(rel)):
             continue
-        if rel in excludes or spec.match_file(rel):
-            continue
-        files.append(path)
+        files.append(repo_root / rel)
     return files
 
+
+def _walk_python_files(directory: str, rel_prefix: str) -> Iterator[str]:
+    pending = [(directory, rel_prefix)]
+    while pending:
+        current, prefix = pending.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIPPED_DIR_NAMES:
+                        pending.append((entry.path, prefix + entry.name + "/"))
+                elif entry.name.endswith(".py"):
+                    yield prefix + entry.name
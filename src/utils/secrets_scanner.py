@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import heapq
+import mmap
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import chain, islice, repeat
 from pathlib import Path
-from typing import List
+from typing import Callable, Iterable, Iterator, List, Set, Tuple
+
+try:
+    import hyperscan
+except Exception:  # pragma: no cover - optional dependency in test envs
+    hyperscan = None
 
 
 @dataclass(frozen=True)
@@ -14,33 +24,161 @@ class SecretFinding:
     snippet: str
 
 
+# Patterns are matched against whole files, so none of them may cross a line break.
 PATTERNS = {
     "aws_access_key": re.compile(r"\bAKIA[0-9A-Z]{16}\b"),
     "github_token": re.compile(r"\bgh[pousr]_[A-Za-z0-9]{20,}\b"),
-    "generic_api_key": re.compile(r"(?i)\b(api[_-]?key|token|secret)\s*[:=]\s*['\"][^'\"]{10,}['\"]"),
+    "generic_api_key": re.compile(r"(?i)\b(api[_-]?key|token|secret)[^\S\r\n]*[:=][^\S\r\n]*['\"][^'\"\r\n]{10,}['\"]"),
 }
 
+_KINDS = tuple(PATTERNS)
+_STR_SEARCHES = tuple(pattern.search for pattern in PATTERNS.values())
+_STR_FINDERS = tuple(pattern.finditer for pattern in PATTERNS.values())
+_BYTE_FINDERS = tuple(re.compile(pattern.pattern.encode("utf-8")).finditer for pattern in PATTERNS.values())
+
+_MATCH_START = re.Match.start
+
+_STR_BREAKS = ("\n", "\r")
+_BYTE_BREAKS = (b"\n", b"\r")
+
+DEFAULT_MAX_SCAN_BYTES = 2 * 1024 * 1024
+BINARY_PROBE_BYTES = 4096
+BINARY_MAGIC = (b"%PDF-", b"\x89PNG", b"\x7fELF", b"\x1f\x8b", b"PK\x03\x04", b"\xff\xd8\xff")
+
+
+def _compile_hyperscan_database():
+    if hyperscan is None:
+        return None
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.pattern.encode("utf-8") for pattern in PATTERNS.values()],
+            ids=list(range(len(_KINDS))),
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(_KINDS),
+        )
+    except Exception:  # pragma: no cover - fall back to the re engine
+        return None
+    return database
+
+
+_HS_DATABASE = _compile_hyperscan_database()
+
 
 def scan_text(content: str, file_path: str) -> List[SecretFinding]:
-    findings: List[SecretFinding] = []
-    for idx, line in enumerate(content.splitlines(), start=1):
-        for kind, pattern in PATTERNS.items():
-            if pattern.search(line):
-                findings.append(
-                    SecretFinding(
-                        file_path=file_path,
-                        line_number=idx,
-                        kind=kind,
-                        snippet=line.strip()[:200],
-                    )
-                )
-    return findings
-
-
-def scan_files(paths: List[Path], repo_root: Path) -> List[SecretFinding]:
-    findings: List[SecretFinding] = []
-    for path in paths:
-        text = path.read_text(encoding="utf-8", errors="ignore")
-        findings.extend(scan_text(text, str(path.relative_to(repo_root))))
-    return findings
+    return list(iter_secrets(content, file_path))
+
+
+def iter_secrets(content: str, file_path: str, limit: int | None = None) -> Iterator[SecretFinding]:
+    if _HS_DATABASE is not None:
+        return _scan_buffer(content.encode("utf-8"), file_path, limit)
+    return islice(_iter_findings(content, _STR_BREAKS, _ordered_hits(content, _STR_FINDERS), file_path), limit)
+
+
+def has_secrets(content: str, file_path: str = "") -> bool:
+    return next(iter_secrets(content, file_path, limit=1), None) is not None
+
+
+def _scan_buffer(buffer, file_path: str, limit: int | None = None) -> Iterator[SecretFinding]:
+    if _HS_DATABASE is not None:
+        hits: Iterable[Tuple[int, int]] = _heap_ordered(_hyperscan_hits(bytes(buffer)))
+    else:
+        hits = _ordered_hits(buffer, _BYTE_FINDERS)
+    return islice(_iter_findings(buffer, _BYTE_BREAKS, hits, file_path), limit)
+
+
+def _ordered_hits(text, finders: Tuple[Callable, ...]) -> Iterator[Tuple[int, int]]:
+    return heapq.merge(*(_pattern_hits(text, finditer, kind_index) for kind_index, finditer in enumerate(finders)))
+
+
+def _pattern_hits(text, finditer: Callable, kind_index: int) -> Iterator[Tuple[int, int]]:
+    return zip(map(_MATCH_START, finditer(text)), repeat(kind_index))
+
+
+def _heap_ordered(hits: Set[Tuple[int, int]]) -> Iterator[Tuple[int, int]]:
+    heap = list(hits)
+    heapq.heapify(heap)
+    while heap:
+        yield heapq.heappop(heap)
+
+
+def _hyperscan_hits(data: bytes) -> Set[Tuple[int, int]]:
+    hits: Set[Tuple[int, int]] = set()
+
+    def on_match(kind_index: int, start: int, end: int, flags: int, context: object) -> None:
+        hits.add((start, kind_index))
+
+    _HS_DATABASE.scan(data, match_event_handler=on_match)
+    return hits
+
+
+def _iter_findings(text, breaks, hits: Iterable[Tuple[int, int]], file_path: str) -> Iterator[SecretFinding]:
+    lf, cr = breaks
+    crlf = cr + lf
+    line_number = 1
+    counted_to = 0
+    line_start = 0
+    line_end = -1
+    kinds: Set[int] = set()
+    for offset, kind_index in hits:
+        if offset >= line_end:
+            if kinds:
+                yield from _line_findings(text, line_start, line_end, line_number, kinds, file_path)
+            line_start = max(text.rfind(lf, 0, offset), text.rfind(cr, 0, offset)) + 1
+            ends = [end for end in (text.find(lf, offset), text.find(cr, offset)) if end != -1]
+            line_end = min(ends) if ends else len(text)
+            # Slicing first keeps this working on mmap objects, which have no count().
+            passed = text[counted_to:line_start]
+            line_number += passed.count(lf) + passed.count(cr) - passed.count(crlf)
+            counted_to = line_start
+            kinds = set()
+        kinds.add(kind_index)
+    if kinds:
+        yield from _line_findings(text, line_start, line_end, line_number, kinds, file_path)
+
+
+def _line_findings(
+    text, line_start: int, line_end: int, line_number: int, kinds: Set[int], file_path: str
+) -> Iterator[SecretFinding]:
+    line = text[line_start:line_end]
+    if not isinstance(line, str):
+        line = line.decode("utf-8", errors="ignore")
+        kinds = {kind_index for kind_index in kinds if _STR_SEARCHES[kind_index](line)}
+    snippet = line.strip()[:200]
+    for kind_index in sorted(kinds):
+        yield SecretFinding(file_path=file_path, line_number=line_number, kind=_KINDS[kind_index], snippet=snippet)
+
+
+def max_scan_bytes() -> int:
+    try:
+        return int(os.getenv("ARGUS_SECRETS_MAX_BYTES", str(DEFAULT_MAX_SCAN_BYTES)))
+    except ValueError:
+        return DEFAULT_MAX_SCAN_BYTES
+
+
+def scan_files(
+    paths: List[Path],
+    repo_root: Path,
+    max_bytes: int | None = None,
+    skipped: List[str] | None = None,
+) -> List[SecretFinding]:
+    if not paths:
+        return []
+    limit = max_scan_bytes() if max_bytes is None else max_bytes
+    max_workers = min(32, (os.cpu_count() or 4) * 4, len(paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(lambda path: _scan_one(path, repo_root, limit), paths))
+    if skipped is not None:
+        skipped.extend(str(path.relative_to(repo_root)) for path, result in zip(paths, results) if result is None)
+    return list(chain.from_iterable(result for result in results if result))
+
 
+def _scan_one(path: Path, repo_root: Path, max_bytes: int) -> List[SecretFinding] | None:
+    size = path.stat().st_size
+    if size > max_bytes:
+        return None
+    if size == 0:
+        return []
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        if buffer[:8].startswith(BINARY_MAGIC) or buffer.find(b"\0", 0, BINARY_PROBE_BYTES) != -1:
+            return []
+        return list(_scan_buffer(buffer, str(path.relative_to(repo_root))))
@@ -1,8 +1,71 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+
+def pytest_addoption(parser) -> None:
+    parser.addoption("--run-slow", action="store_true", default=False, help="also run tests marked slow")
+
+
+def pytest_configure(config) -> None:
+    config.addinivalue_line("markers", "slow: long-running test, skipped unless --run-slow is given")
+
+
+def pytest_collection_modifyitems(config, items) -> None:
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(autouse=True)
+def _reset_verifier_caches():
+    from src.core.verifier import dafny_verifier, lean_verifier
+
+    def _clear() -> None:
+        dafny_verifier.dafny_accepts_stdin.cache_clear()
+        lean_verifier.lean_accepts_stdin.cache_clear()
+
+    _clear()
+    yield
+    _clear()
+
+
+@pytest.fixture(scope="session")
+def sample_file_report():
+    from src.core.models import AssumedInput, Obligation, Verdict
+    from src.core.reporter import FileReport
+
+    # Renderers only read their inputs, so one instance serves the whole session.
+    return FileReport(
+        filename="withdraw.py",
+        verdict=Verdict.VERIFIED,
+        obligations=[
+            Obligation(
+                id="withdraw:non_negative_result",
+                property="withdraw(...) >= 0",
+                category="non_negativity",
+                description="non-negative",
+            )
+        ],
+        assumptions=[
+            AssumedInput(
+                property="amount > 0",
+                description="validated amount",
+                justification="schema",
+                source_type="api_schema",
+                source_ref="WithdrawRequest.amount",
+                evidence_id="schema-v1",
+            )
+        ],
+        engine="lean",
+        message="ok",
+    )
@@ -1,6 +1,8 @@
+from pathlib import Path
 from types import SimpleNamespace
 
 from src.core.models import Obligation
+from src.core.verifier.base import run_bundle_jobs
 from src.core.verifier.dafny_verifier import DafnyVerifier
 
 
@@ -23,3 +25,316 @@ def test_dafny_verifier_success(monkeypatch) -> None:
     assert outcome.all_passed
     assert not outcome.verification_error
 
+
+def test_dafny_verifier_detects_error_count_case_insensitively(monkeypatch) -> None:
+    def _fake_run(*args, **kwargs):
+        return SimpleNamespace(returncode=0, stdout="Dafny program verifier finished with 1 verified, 2 Errors", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.dafny_accepts_stdin", lambda: True)
+
+    obligation = Obligation(id="f:post", property="post", category="postcondition", description="post")
+    outcome = DafnyVerifier(require_docker=False).verify("method F() { }", [obligation])
+    assert not outcome.all_passed
+    assert not outcome.verification_error
+
+
+def test_dafny_verify_bundle_uses_single_invocation(monkeypatch) -> None:
+    calls = []
+
+    def _fake_run(cmd, **kwargs):
+        assert cmd == ["dafny", "verify", "--stdin"]
+        calls.append(kwargs["input"])
+        return SimpleNamespace(returncode=0, stdout="Dafny verified, 0 errors", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.dafny_accepts_stdin", lambda: True)
+
+    obligation = Obligation(id="f:loop", property="loop safe", category="loop_invariant", description="loop")
+    verifier = DafnyVerifier(require_docker=False)
+    outcomes = verifier.verify_bundle(
+        [
+            ("a.py", "method A() returns (result:int) { result := 0; }", [obligation]),
+            ("b.py", "method B() returns (result:int) { result := 0; }", [obligation]),
+        ]
+    )
+    assert len(calls) == 1
+    assert "module M_0 {" in calls[0] and "module M_1 {" in calls[0]
+    assert all(outcome.all_passed for outcome in outcomes)
+
+
+def test_dafny_verify_bundle_caps_the_bundle_timeout(monkeypatch) -> None:
+    timeouts = []
+
+    def _fake_run(cmd, **kwargs):
+        timeouts.append(kwargs["timeout"])
+        return SimpleNamespace(returncode=0, stdout="Dafny verified, 0 errors", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.dafny_accepts_stdin", lambda: True)
+
+    obligation = Obligation(id="f:loop", property="loop safe", category="loop_invariant", description="loop")
+    DafnyVerifier(timeout=30, require_docker=False).verify_bundle(
+        [(f"f{index}.py", f"method F{index}() {{}}", [obligation]) for index in range(6)]
+    )
+    assert timeouts == [60]
+
+
+def test_dafny_verify_bundle_falls_back_per_file_on_failure(monkeypatch) -> None:
+    calls = []
+
+    def _fake_run(cmd, **kwargs):
+        code = kwargs["input"]
+        calls.append(code)
+        if "method B" in code:
+            return SimpleNamespace(returncode=4, stdout="Dafny program verifier finished with 0 verified, 1 error", stderr="")
+        return SimpleNamespace(returncode=0, stdout="Dafny verified, 0 errors", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.dafny_accepts_stdin", lambda: True)
+
+    obligation = Obligation(id="f:loop", property="loop safe", category="loop_invariant", description="loop")
+    verifier = DafnyVerifier(require_docker=False)
+    outcomes = verifier.verify_bundle(
+        [
+            ("a.py", "method A() returns (result:int) { result := 0; }", [obligation]),
+            ("b.py", "method B() returns (result:int) { result := 0; }", [obligation]),
+        ]
+    )
+    assert len(calls) == 3
+    assert outcomes[0].all_passed
+    assert not outcomes[1].all_passed
+
+
+def test_dafny_verify_bundle_reruns_only_attributed_modules(monkeypatch) -> None:
+    calls = []
+    failure = "stdin.dfy(6,2): Error: a postcondition could not be proved\nDafny program verifier finished with 1 verified, 1 error"
+
+    def _fake_run(cmd, **kwargs):
+        code = kwargs["input"]
+        calls.append(code)
+        if "method B" in code:
+            return SimpleNamespace(returncode=4, stdout=failure, stderr="")
+        return SimpleNamespace(returncode=0, stdout="Dafny verified, 0 errors", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.dafny_accepts_stdin", lambda: True)
+
+    obligation = Obligation(id="f:loop", property="loop safe", category="loop_invariant", description="loop")
+    outcomes = DafnyVerifier(require_docker=False).verify_bundle(
+        [
+            ("a.py", "method A() returns (result:int) { result := 0; }", [obligation]),
+            ("b.py", "method B() returns (result:int) { result := 0; }", [obligation]),
+        ]
+    )
+    assert len(calls) == 2
+    assert calls[1] == "method B() returns (result:int) { result := 0; }"
+    assert outcomes[0].all_passed
+    assert not outcomes[1].all_passed
+
+
+def test_dafny_verify_bundle_reruns_all_modules_when_summary_reports_time_out(monkeypatch) -> None:
+    calls = []
+    failure = (
+        "stdin.dfy(2,2): Error: a postcondition could not be proved\n"
+        "stdin.dfy(5,0): Verification of 'B' timed out after 10 seconds\n"
+        "Dafny program verifier finished with 0 verified, 1 error, 1 time out"
+    )
+
+    def _fake_run(cmd, **kwargs):
+        calls.append(kwargs["input"])
+        return SimpleNamespace(returncode=4, stdout=failure, stderr="")
+
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.dafny_accepts_stdin", lambda: True)
+
+    obligation = Obligation(id="f:loop", property="loop safe", category="loop_invariant", description="loop")
+    outcomes = DafnyVerifier(require_docker=False).verify_bundle(
+        [
+            ("a.py", "method A() returns (result:int) { result := 0; }", [obligation]),
+            ("b.py", "method B() returns (result:int) { result := 0; }", [obligation]),
+        ]
+    )
+    assert calls[1:] == [
+        "method A() returns (result:int) { result := 0; }",
+        "method B() returns (result:int) { result := 0; }",
+    ]
+    assert not outcomes[0].all_passed
+    assert not outcomes[1].all_passed
+
+
+def test_dafny_verifier_falls_back_to_temp_file_without_stdin_support(monkeypatch) -> None:
+    commands = []
+
+    def _fake_run(cmd, **kwargs):
+        commands.append(cmd)
+        if cmd[-1] == "--help":
+            return SimpleNamespace(returncode=0, stdout="Usage: dafny verify [options] <file>...", stderr="")
+        assert "input" not in kwargs
+        return SimpleNamespace(returncode=0, stdout="Dafny verified, 0 errors", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.subprocess.run", _fake_run)
+
+    obligation = Obligation(id="f:loop", property="loop safe", category="loop_invariant", description="loop")
+    verifier = DafnyVerifier(require_docker=False)
+    assert verifier.verify("method F() returns (result:int) { result := 0; }", [obligation]).all_passed
+    assert verifier.verify("method G() returns (result:int) { result := 0; }", [obligation]).all_passed
+    assert [cmd[-1] for cmd in commands].count("--help") == 1
+    assert commands[1][-1].endswith(".dfy")
+    assert commands[2][-1] == commands[1][-1]
+    assert Path(commands[1][-1]).read_text(encoding="utf-8") == "method G() returns (result:int) { result := 0; }"
+    assert Path(commands[1][-1]).parent.stat().st_mode & 0o777 == 0o700
+
+
+def test_dafny_verifier_isolates_failing_method(monkeypatch) -> None:
+    proof = (
+        "method Deposit(x: int) returns (result: int)\n"
+        "  ensures result >= 0\n"
+        "{\n"
+        "  result := 0;\n"
+        "}\n"
+        "\n"
+        "method Withdraw(x: int) returns (result: int)\n"
+        "  ensures result >= 0\n"
+        "{\n"
+        "  result := x;\n"
+        "}\n"
+    )
+    inputs = []
+
+    def _fake_run(cmd, **kwargs):
+        inputs.append((cmd, kwargs["input"]))
+        return SimpleNamespace(
+            returncode=4,
+            stdout=(
+                "<stdin>(10,2): Error: a postcondition could not be proved on this return path\n"
+                "Dafny program verifier finished with 1 verified, 1 error"
+            ),
+            stderr="",
+        )
+
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.dafny_accepts_stdin", lambda: True)
+
+    obligations = [
+        Obligation(id="deposit:non_negative_result", property="deposit(...) >= 0", category="non_negativity", description="d"),
+        Obligation(id="withdraw:non_negative_result", property="withdraw(...) >= 0", category="non_negativity", description="w"),
+    ]
+    outcome = DafnyVerifier(require_docker=False).verify(proof, obligations)
+
+    assert len(inputs) == 2
+    assert "method {:isolate_assertions} Withdraw(" in inputs[1][1]
+    assert "method Deposit(" in inputs[1][1]
+    assert "--cores" in inputs[1][0]
+    assert [item.verified for item in outcome.obligation_results] == [True, False]
+    assert "postcondition" in outcome.obligation_results[1].message
+    assert not outcome.all_passed
+
+
+def test_dafny_verifier_does_not_attribute_errors_in_helper_functions(monkeypatch) -> None:
+    proof = (
+        "method Deposit(x: int) returns (result: int)\n"
+        "  ensures result >= 0\n"
+        "{\n"
+        "  result := 0;\n"
+        "}\n"
+        "\n"
+        "function h(x: int): int\n"
+        "  ensures h(x) >= 0\n"
+        "{\n"
+        "  x\n"
+        "}\n"
+        "\n"
+        "method Withdraw(x: int) returns (result: int)\n"
+        "  ensures result >= 0\n"
+        "{\n"
+        "  result := 0;\n"
+        "}\n"
+    )
+    inputs = []
+
+    def _fake_run(cmd, **kwargs):
+        inputs.append(kwargs["input"])
+        return SimpleNamespace(
+            returncode=4,
+            stdout=(
+                "<stdin>(8,10): Error: a postcondition could not be proved on this return path\n"
+                "Dafny program verifier finished with 2 verified, 1 error"
+            ),
+            stderr="",
+        )
+
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.dafny_accepts_stdin", lambda: True)
+
+    obligations = [
+        Obligation(id="deposit:non_negative_result", property="deposit(...) >= 0", category="non_negativity", description="d"),
+        Obligation(id="withdraw:non_negative_result", property="withdraw(...) >= 0", category="non_negativity", description="w"),
+    ]
+    outcome = DafnyVerifier(require_docker=False).verify(proof, obligations)
+
+    assert len(inputs) == 1
+    assert [item.verified for item in outcome.obligation_results] == [False, False]
+
+
+def test_dafny_verifier_keeps_first_attribution_when_rerun_blames_helper(monkeypatch) -> None:
+    proof = (
+        "method Deposit(x: int) returns (result: int)\n"
+        "  ensures result >= 0\n"
+        "{\n"
+        "  result := 0;\n"
+        "}\n"
+        "\n"
+        "method Withdraw(x: int) returns (result: int)\n"
+        "  ensures result >= 0\n"
+        "{\n"
+        "  result := h(x);\n"
+        "}\n"
+        "\n"
+        "function h(x: int): int\n"
+        "{\n"
+        "  x\n"
+        "}\n"
+    )
+    outputs = iter(
+        [
+            "<stdin>(10,2): Error: a postcondition could not be proved on this return path\n"
+            "Dafny program verifier finished with 1 verified, 1 error",
+            "<stdin>(15,2): Error: value does not satisfy the subset constraints\n"
+            "Dafny program verifier finished with 2 verified, 1 error",
+        ]
+    )
+
+    def _fake_run(cmd, **kwargs):
+        return SimpleNamespace(returncode=4, stdout=next(outputs), stderr="")
+
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.dafny_accepts_stdin", lambda: True)
+
+    obligations = [
+        Obligation(id="deposit:non_negative_result", property="deposit(...) >= 0", category="non_negativity", description="d"),
+        Obligation(id="withdraw:non_negative_result", property="withdraw(...) >= 0", category="non_negativity", description="w"),
+    ]
+    outcome = DafnyVerifier(require_docker=False).verify(proof, obligations)
+
+    assert [item.verified for item in outcome.obligation_results] == [True, False]
+    assert "postcondition" in outcome.obligation_results[1].message
+    assert not outcome.all_passed
+
+
+def test_dafny_bundle_jobs_keep_file_order(monkeypatch) -> None:
+    def _fake_run(cmd, **kwargs):
+        failing = "method Bad" in kwargs["input"]
+        return SimpleNamespace(returncode=4 if failing else 0, stdout="1 error" if failing else "0 errors", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.dafny_verifier.dafny_accepts_stdin", lambda: True)
+    monkeypatch.setenv("ARGUS_VERIFY_WORKERS", "4")
+
+    obligation = Obligation(id="f:loop", property="loop safe", category="loop_invariant", description="loop")
+    files = [
+        (f"f{index}.py", f"method {'Bad' if index % 3 == 0 else 'Good'}{index}() {{}}", [obligation])
+        for index in range(9)
+    ]
+    outcomes = run_bundle_jobs(DafnyVerifier(require_docker=False).verify_bundle, files)
+    assert [outcome.all_passed for outcome in outcomes] == [index % 3 != 0 for index in range(9)]
@@ -0,0 +1,54 @@
+import os
+
+from src.utils.file_router import discover_python_files, load_argusignore
+
+
+def test_load_argusignore_reuses_spec_until_file_changes(tmp_path) -> None:
+    ignore_file = tmp_path / ".argusignore"
+    ignore_file.write_text("generated/\n", encoding="utf-8")
+    first = load_argusignore(tmp_path)
+    assert load_argusignore(tmp_path) is first
+
+    ignore_file.write_text("generated/\nscripts/\n", encoding="utf-8")
+    stat = ignore_file.stat()
+    os.utime(ignore_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = load_argusignore(tmp_path)
+    assert second is not first
+    assert second.match_file("scripts/run.py")
+
+
+def test_load_argusignore_caches_empty_spec_without_file(tmp_path) -> None:
+    spec = load_argusignore(tmp_path)
+    assert load_argusignore(tmp_path) is spec
+    assert not spec.patterns
+    (tmp_path / "app.py").write_text("", encoding="utf-8")
+    assert discover_python_files(tmp_path, extra_excludes=["other.py"]) == [tmp_path / "app.py"]
+
+
+def test_discover_python_files_applies_argusignore(tmp_path) -> None:
+    (tmp_path / ".argusignore").write_text("generated/\n", encoding="utf-8")
+    for rel in ["app.py", "generated/stub.py", "venv/lib/site.py", "pkg/core.py", "pkg/notes.txt"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+
+    found = sorted(path.relative_to(tmp_path).as_posix() for path in discover_python_files(tmp_path))
+    assert found == ["app.py", "pkg/core.py"]
+
+
+def test_discover_python_files_skips_unreadable_directories(tmp_path, monkeypatch) -> None:
+    for rel in ["app.py", "locked/secret.py"]:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+    scandir = os.scandir
+
+    def _scandir(path):
+        if os.path.basename(path) == "locked":
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr("src.utils.file_router.os.scandir", _scandir)
+
+    found = sorted(path.relative_to(tmp_path).as_posix() for path in discover_python_files(tmp_path))
+    assert found == ["app.py"]
@@ -0,0 +1,16 @@
+from types import SimpleNamespace
+
+from src.utils.git_ops import changed_python_files
+
+
+def test_changed_python_files_parses_nul_separated_output(monkeypatch, tmp_path) -> None:
+    seen = {}
+
+    def _fake_run(cmd, **kwargs):
+        seen["cmd"] = cmd
+        return SimpleNamespace(returncode=0, stdout=b"pkg/with space.py\0README.md\0app.py\0line\nbreak.py\0", stderr=b"")
+
+    monkeypatch.setattr("src.utils.git_ops.subprocess.run", _fake_run)
+
+    assert changed_python_files(tmp_path, base_ref="main") == ["pkg/with space.py", "app.py", "line\nbreak.py"]
+    assert seen["cmd"] == ["git", "diff", "-z", "--name-only", "--diff-filter=AMR", "main", "HEAD"]
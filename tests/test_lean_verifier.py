@@ -1,6 +1,9 @@
+import threading
+from pathlib import Path
 from types import SimpleNamespace
 
 from src.core.models import Obligation
+from src.core.verifier.base import run_bundle_jobs
 from src.core.verifier.lean_verifier import LeanVerifier
 
 
@@ -39,3 +42,270 @@ def test_lean_verifier_fails_if_docker_required(monkeypatch, tmp_path) -> None:
     assert outcome.verification_error
     assert not outcome.all_passed
 
+
+def test_lean_verify_bundle_hoists_imports_into_one_file(monkeypatch, tmp_path) -> None:
+    calls = []
+
+    def _fake_run(cmd, cwd, **kwargs):
+        calls.append((Path(cwd) / cmd[-1]).read_text(encoding="utf-8"))
+        return SimpleNamespace(returncode=0, stdout="ok", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.lean_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.lean_verifier.lean_accepts_stdin", lambda project_dir: False)
+
+    obligation = Obligation(
+        id="f:non_negative_result",
+        property="f(...) >= 0",
+        category="non_negativity",
+        description="non-negative",
+    )
+    verifier = LeanVerifier(project_dir=str(tmp_path), require_docker=False)
+    outcomes = verifier.verify_bundle(
+        [
+            ("a.py", "import Mathlib.Tactic.Linarith\ndef f (x : Int) : Int := x", [obligation]),
+            ("b.py", "import Mathlib.Tactic.Linarith\ndef g (x : Int) : Int := x", [obligation]),
+        ]
+    )
+    assert len(calls) == 1
+    assert calls[0].startswith("import Mathlib.Tactic.Linarith\n\nnamespace argus_0\n")
+    assert calls[0].count("import ") == 1
+    assert "end argus_1" in calls[0]
+    assert all(outcome.all_passed for outcome in outcomes)
+
+
+def test_lean_verify_bundle_does_not_share_imports_between_files(monkeypatch, tmp_path) -> None:
+    calls = []
+
+    def _fake_run(cmd, **kwargs):
+        calls.append(kwargs["input"])
+        return SimpleNamespace(returncode=0, stdout="ok", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.lean_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.lean_verifier.lean_accepts_stdin", lambda project_dir: True)
+
+    obligation = Obligation(id="f:non_negative_result", property="f(...) >= 0", category="non_negativity", description="a")
+    verifier = LeanVerifier(project_dir=str(tmp_path), require_docker=False)
+    verifier.verify_bundle(
+        [
+            ("a.py", "import Mathlib.Tactic.Linarith\ndef f (x : Int) : Int := x", [obligation]),
+            ("b.py", "def g (x : Int) : Int := by linarith", [obligation]),
+            ("c.py", "import Mathlib.Tactic.Linarith\ndef h (x : Int) : Int := x", [obligation]),
+        ]
+    )
+    assert len(calls) == 2
+    assert calls[0].count("namespace argus_") == 2
+    assert "def g" not in calls[0]
+    assert calls[1] == "def g (x : Int) : Int := by linarith"
+
+
+def test_lean_verify_bundle_runs_files_with_global_commands_alone(monkeypatch, tmp_path) -> None:
+    calls = []
+
+    def _fake_run(cmd, **kwargs):
+        calls.append(kwargs["input"])
+        return SimpleNamespace(returncode=0, stdout="ok", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.lean_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.lean_verifier.lean_accepts_stdin", lambda project_dir: True)
+
+    obligation = Obligation(id="f:non_negative_result", property="f(...) >= 0", category="non_negativity", description="a")
+    simp_lemma = "@[simp] theorem f_eq (x : Int) : x + 0 = x := by omega"
+    verifier = LeanVerifier(project_dir=str(tmp_path), require_docker=False)
+    verifier.verify_bundle(
+        [
+            ("a.py", simp_lemma, [obligation]),
+            ("b.py", "def g (x : Int) : Int := x", [obligation]),
+            ("c.py", "def h (x : Int) : Int := x", [obligation]),
+        ]
+    )
+    assert calls[0] == simp_lemma
+    assert len(calls) == 2
+    assert calls[1].count("namespace argus_") == 2
+    assert "f_eq" not in calls[1]
+
+
+def test_lean_verifier_allows_local_override(monkeypatch, tmp_path) -> None:
+    def _fake_run(*args, **kwargs):
+        return SimpleNamespace(returncode=0, stdout="ok", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.lean_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.base.RUNNING_IN_DOCKER", False)
+    monkeypatch.setenv("ARGUS_ALLOW_LOCAL_VERIFY", "true")
+    obligations = [
+        Obligation(
+            id="f:non_negative_result",
+            property="f(...) >= 0",
+            category="non_negativity",
+            description="non-negative",
+        )
+    ]
+    verifier = LeanVerifier(project_dir=str(tmp_path), require_docker=True)
+    outcome = verifier.verify("def f (x : Int) : Int := x", obligations)
+    assert not outcome.verification_error
+    assert outcome.all_passed
+
+
+def test_lean_verifier_reuses_idle_scratch_projects(monkeypatch, tmp_path) -> None:
+    project = tmp_path / "lean_project"
+    (project / ".lake" / "build" / "lib").mkdir(parents=True)
+    (project / ".lake" / "build" / "lib" / "LeanProject.olean").write_bytes(b"olean")
+    (project / "lakefile.lean").write_text("import Lake\n", encoding="utf-8")
+    cwds = []
+    both_running = threading.Barrier(2, timeout=5)
+
+    def _fake_run(cmd, cwd, **kwargs):
+        cwds.append(Path(cwd))
+        if "concurrent" in kwargs["input"]:
+            both_running.wait()
+        return SimpleNamespace(returncode=0, stdout="ok", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.lean_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.lean_verifier.lean_accepts_stdin", lambda project_dir: True)
+
+    obligation = Obligation(
+        id="f:non_negative_result",
+        property="f(...) >= 0",
+        category="non_negativity",
+        description="non-negative",
+    )
+    verifier = LeanVerifier(project_dir=str(project), require_docker=False, per_worker_project=True)
+    verifier.verify("def f (x : Int) : Int := x", [obligation])
+    worker = threading.Thread(target=verifier.verify, args=("def f (x : Int) : Int := x + 0", [obligation]))
+    worker.start()
+    worker.join()
+    workers = [
+        threading.Thread(target=verifier.verify, args=(f"-- concurrent {index}\ndef f (x : Int) : Int := x", [obligation]))
+        for index in range(2)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert cwds[0] == cwds[1]
+    assert cwds[2] != cwds[3]
+    assert len(set(cwds)) == 2
+    assert project not in cwds
+    olean = cwds[0] / ".lake" / "build" / "lib" / "LeanProject.olean"
+    assert olean.stat().st_ino == (project / ".lake" / "build" / "lib" / "LeanProject.olean").stat().st_ino
+    assert (cwds[0] / "lakefile.lean").is_symlink()
+
+    verifier.close()
+    assert not any(path.exists() for path in cwds)
+    assert (project / ".lake" / "build" / "lib" / "LeanProject.olean").exists()
+
+
+def test_lean_verifier_refresh_env_rereads_local_override(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr("src.core.verifier.base.RUNNING_IN_DOCKER", False)
+    monkeypatch.delenv("ARGUS_ALLOW_LOCAL_VERIFY", raising=False)
+    verifier = LeanVerifier(project_dir=str(tmp_path), require_docker=True)
+    monkeypatch.setenv("ARGUS_ALLOW_LOCAL_VERIFY", "true")
+    assert not verifier._allow_local_verify
+    verifier.refresh_env()
+    assert verifier._allow_local_verify
+
+
+def test_lean_verifier_reuses_cached_outcome(monkeypatch, tmp_path) -> None:
+    calls = []
+
+    def _fake_run(*args, **kwargs):
+        calls.append(args)
+        return SimpleNamespace(returncode=0, stdout="ok", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.lean_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.lean_verifier.lean_accepts_stdin", lambda project_dir: True)
+
+    first = Obligation(id="f:non_negative_result", property="f(...) >= 0", category="non_negativity", description="a")
+    renamed = Obligation(id="f:non_negative_result", property="f(...) >= 0", category="non_negativity", description="b")
+    verifier = LeanVerifier(project_dir=str(tmp_path), require_docker=False)
+    verifier.verify("def f (x : Int) : Int := x", [first])
+    outcome = verifier.verify("def f (x : Int) : Int := x", [renamed])
+
+    assert len(calls) == 1
+    assert outcome.all_passed
+    assert outcome.obligation_results[0].obligation is renamed
+
+
+def test_lean_scratch_projects_are_reused_across_batches(monkeypatch, tmp_path) -> None:
+    project = tmp_path / "lean_project"
+    project.mkdir()
+    (project / "lakefile.lean").write_text("import Lake\n", encoding="utf-8")
+    probes = []
+
+    def _fake_run(cmd, cwd, **kwargs):
+        return SimpleNamespace(returncode=0, stdout="ok", stderr="")
+
+    def _probe(project_dir):
+        probes.append(project_dir)
+        return True
+
+    monkeypatch.setattr("src.core.verifier.lean_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.lean_verifier.lean_accepts_stdin", _probe)
+    monkeypatch.setenv("ARGUS_VERIFY_WORKERS", "2")
+
+    obligation = Obligation(id="f:non_negative_result", property="f(...) >= 0", category="non_negativity", description="a")
+    verifier = LeanVerifier(project_dir=str(project), require_docker=False, per_worker_project=True)
+    for batch in range(3):
+        files = [(f"f{index}.py", f"def f{batch}_{index} (x : Int) : Int := x", [obligation]) for index in range(4)]
+        assert all(outcome.all_passed for outcome in run_bundle_jobs(verifier.verify_bundle, files))
+
+    assert 1 <= len(verifier._scratch_dirs) <= 2
+    assert set(probes) == {str(project)}
+    verifier.close()
+
+
+def test_lean_verifier_pipes_source_when_stdin_is_supported(monkeypatch, tmp_path) -> None:
+    calls = []
+
+    def _fake_run(cmd, **kwargs):
+        calls.append((cmd, kwargs.get("input")))
+        if cmd[-1] == "--help":
+            return SimpleNamespace(returncode=0, stdout="usage: lean [--stdin] file", stderr="")
+        return SimpleNamespace(returncode=0, stdout="ok", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.lean_verifier.subprocess.run", _fake_run)
+
+    obligation = Obligation(id="f:non_negative_result", property="f(...) >= 0", category="non_negativity", description="a")
+    verifier = LeanVerifier(project_dir=str(tmp_path), require_docker=False)
+    assert verifier.verify("def f (x : Int) : Int := x", [obligation]).all_passed
+    assert verifier.verify("def g (x : Int) : Int := x", [obligation]).all_passed
+
+    assert [cmd[-1] for cmd, _ in calls] == ["--help", "--stdin", "--stdin"]
+    assert calls[1][1] == "def f (x : Int) : Int := x"
+    assert not list(tmp_path.glob("argus_*.lean"))
+
+
+def test_lean_verify_bundle_checks_docker_gate_before_cache(monkeypatch, tmp_path) -> None:
+    def _fake_run(*args, **kwargs):
+        return SimpleNamespace(returncode=0, stdout="ok", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.lean_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.lean_verifier.lean_accepts_stdin", lambda project_dir: True)
+    monkeypatch.setattr("src.core.verifier.base.RUNNING_IN_DOCKER", True)
+    monkeypatch.delenv("ARGUS_ALLOW_LOCAL_VERIFY", raising=False)
+
+    obligation = Obligation(id="f:non_negative_result", property="f(...) >= 0", category="non_negativity", description="a")
+    verifier = LeanVerifier(project_dir=str(tmp_path), require_docker=True)
+    assert verifier.verify("def f (x : Int) : Int := x", [obligation]).all_passed
+
+    monkeypatch.setattr("src.core.verifier.base.RUNNING_IN_DOCKER", False)
+    outcomes = verifier.verify_bundle([("f.py", "def f (x : Int) : Int := x", [obligation])])
+    assert outcomes[0].verification_error
+    assert not outcomes[0].all_passed
+
+
+def test_lean_verifiers_do_not_share_cached_outcomes(monkeypatch, tmp_path) -> None:
+    calls = []
+
+    def _fake_run(command, **kwargs):
+        calls.append(kwargs["cwd"])
+        return SimpleNamespace(returncode=0, stdout="ok", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.lean_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.lean_verifier.lean_accepts_stdin", lambda project_dir: True)
+
+    obligation = Obligation(id="f:non_negative_result", property="f(...) >= 0", category="non_negativity", description="a")
+    for name in ("first", "second"):
+        (tmp_path / name).mkdir()
+        LeanVerifier(project_dir=str(tmp_path / name), require_docker=False).verify("def f (x : Int) : Int := x", [obligation])
+    assert calls == [str(tmp_path / "first"), str(tmp_path / "second")]
@@ -38,3 +38,55 @@ def test_pipeline_unverified_on_unsupported_construct(tmp_path) -> None:
     )
     assert result.verdict == Verdict.UNVERIFIED
 
+
+def test_pipeline_run_many_verifies_batch(monkeypatch, tmp_path) -> None:
+    def _fake_run(*args, **kwargs):
+        return SimpleNamespace(returncode=0, stdout="ok", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.lean_verifier.subprocess.run", _fake_run)
+    monkeypatch.setenv("ARGUS_VERIFY_WORKERS", "2")
+
+    config = PipelineConfig(
+        allow_repair=False,
+        require_docker_verify=False,
+        trace_root=str(tmp_path / ".argus-trace"),
+    )
+    pipeline = ArgusPipeline(config=config)
+    reports = pipeline.run_many(
+        [
+            ("withdraw.py", "def withdraw(balance: int, amount: int) -> int:\n    return balance - amount\n"),
+            ("worker.py", "async def worker():\n    return 1\n"),
+            ("deposit.py", "def deposit(balance: int, amount: int) -> int:\n    return balance + amount\n"),
+        ]
+    )
+    assert [report.filename for report in reports] == ["withdraw.py", "worker.py", "deposit.py"]
+    assert reports[0].verdict in {Verdict.VERIFIED, Verdict.FIXED}
+    assert reports[1].verdict == Verdict.UNVERIFIED
+    assert reports[2].verdict in {Verdict.VERIFIED, Verdict.FIXED}
+
+
+def test_pipeline_run_many_bundles_files_per_worker(monkeypatch, tmp_path) -> None:
+    commands = []
+
+    def _fake_run(command, *args, **kwargs):
+        commands.append(command)
+        return SimpleNamespace(returncode=0, stdout="ok", stderr="")
+
+    monkeypatch.setattr("src.core.verifier.lean_verifier.subprocess.run", _fake_run)
+    monkeypatch.setattr("src.core.verifier.lean_verifier.lean_accepts_stdin", lambda project_dir: True)
+    monkeypatch.setenv("ARGUS_VERIFY_WORKERS", "2")
+
+    config = PipelineConfig(
+        allow_repair=False,
+        require_docker_verify=False,
+        trace_root=str(tmp_path / ".argus-trace"),
+    )
+    pipeline = ArgusPipeline(config=config)
+    files = [
+        (f"op_{index}.py", f"def op_{index}(balance: int, amount: int) -> int:\n    return balance + amount\n")
+        for index in range(4)
+    ]
+    reports = pipeline.run_many(files)
+    assert [report.filename for report in reports] == [name for name, _ in files]
+    assert all(report.verdict == Verdict.VERIFIED for report in reports)
+    assert len(commands) == 2
@@ -1,11 +1,20 @@
+import pytest
+
 from src.core.quality_gates import obligation_determinism_gate
 
 
-def test_obligation_determinism_gate_passes_for_stable_policy() -> None:
-    code = """
+WITHDRAW = """
 def withdraw(balance: int, amount: int) -> int:
     return balance - amount
 """
-    result = obligation_determinism_gate(code, runs=5)
+
+
+def test_obligation_determinism_gate_passes_for_stable_policy() -> None:
+    result = obligation_determinism_gate(WITHDRAW, runs=2)
     assert result.passed
 
+
+@pytest.mark.slow
+def test_obligation_determinism_gate_stress() -> None:
+    result = obligation_determinism_gate(WITHDRAW, runs=5)
+    assert result.passed
@@ -2,42 +2,37 @@ from src.core.models import Obligation
 from src.core.semantic_guard import run_semantic_guard
 
 
+WITHDRAW_SRC = "def withdraw(balance, amount): return balance - amount"
+WITHDRAW_OBLIGATIONS = [
+    Obligation(
+        id="withdraw:non_negative_result",
+        property="withdraw(...) >= 0",
+        category="non_negativity",
+        description="non-negative",
+    )
+]
+
+
 def test_semantic_guard_detects_sorry() -> None:
-    obligations = [
-        Obligation(
-            id="withdraw:non_negative_result",
-            property="withdraw(...) >= 0",
-            category="non_negativity",
-            description="non-negative",
-        )
-    ]
     result = run_semantic_guard(
-        python_code="def withdraw(balance, amount): return balance - amount",
+        python_code=WITHDRAW_SRC,
         translated_code="theorem withdraw_safe := by sorry",
-        obligations=obligations,
+        obligations=WITHDRAW_OBLIGATIONS,
     )
     assert not result.passed
     assert any(issue.code == "PROOF_SORRY" for issue in result.issues)
 
 
 def test_semantic_guard_passes_for_expected_encoding() -> None:
-    obligations = [
-        Obligation(
-            id="withdraw:non_negative_result",
-            property="withdraw(...) >= 0",
-            category="non_negativity",
-            description="non-negative",
-        )
-    ]
     translated = """
 def withdraw (balance amount : Int) : Int := balance - amount
 theorem withdraw_safe (balance amount : Int) : withdraw balance amount >= 0 := by
   omega
 """
     result = run_semantic_guard(
-        python_code="def withdraw(balance, amount): return balance - amount",
+        python_code=WITHDRAW_SRC,
         translated_code=translated,
-        obligations=obligations,
+        obligations=WITHDRAW_OBLIGATIONS,
     )
     assert result.passed
 
@@ -1,16 +1,33 @@
+import pytest
+
 from src.core.verifier import DafnyVerifier, LeanVerifier, VerifierRouter
 
 
-def test_router_selects_dafny_for_loops() -> None:
-    router = VerifierRouter(lean=LeanVerifier(require_docker=False), dafny=DafnyVerifier(require_docker=False))
+@pytest.fixture(scope="module")
+def router() -> VerifierRouter:
+    # select_engine reads no router state, so one instance serves every test here.
+    return VerifierRouter(lean=LeanVerifier(require_docker=False), dafny=DafnyVerifier(require_docker=False))
+
+
+def test_router_selects_dafny_for_loops(router) -> None:
     selection = router.select_engine(
         "def total(xs):\n    s = 0\n    for x in xs:\n        s += x\n    return s\n"
     )
     assert selection.engine == "dafny"
 
 
-def test_router_selects_lean_for_non_loops() -> None:
-    router = VerifierRouter(lean=LeanVerifier(require_docker=False), dafny=DafnyVerifier(require_docker=False))
+def test_router_selects_lean_for_non_loops(router) -> None:
     selection = router.select_engine("def f(x):\n    return x + 1\n")
     assert selection.engine == "lean"
 
+
+def test_router_selects_dafny_for_async_for(router) -> None:
+    selection = router.select_engine("async def total(xs):\n    async for x in xs:\n        pass\n")
+    assert selection.engine == "dafny"
+
+
+def test_router_reuses_selection_for_identical_source(router) -> None:
+    source = "def g(n):\n    while n:\n        n -= 1\n    return n\n"
+    first = router.select_engine(source)
+    assert router.select_engine(source) is first
+    assert router.select_engine("def broken(:\n").reason == "syntax_error_fallback"